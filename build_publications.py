@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""Generate publications.html from publications.csv.
+
+Keeps the paper list out of hand-edited HTML: edit publications.csv
+(one row per paper, oldest first) and rerun this script.  The output
+page reuses the site's existing stylesheet (assets/css/main.css).
+
+Usage: python3 build_publications.py
+"""
+
+import collections
+import concurrent.futures
+import csv
+import gzip
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+
+CSV_FILE = "publications.csv"
+OUT_FILE = "publications.html"
+CACHE_FILE = ".publications_cache.json"
+
+# Inline markdown emphasis, applied after HTML-escaping.
+_RE_BOLD_STAR = re.compile(r"\*\*(.+?)\*\*")
+_RE_BOLD_UND = re.compile(r"__(.+?)__")
+_RE_EM_STAR = re.compile(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)")
+_RE_EM_UND = re.compile(r"(?<!_)_(?!_)(.+?)(?<!_)_(?!_)")
+
+# Whitelisted literal tags that survive escaping, canonicalized to em/strong.
+_TAG_RE = re.compile(r"&lt;(/?)(em|i|strong|b)&gt;")
+
+
+def _tag_sub(m: "re.Match[str]") -> str:
+    slash, name = m.group(1), m.group(2)
+    canon = {"i": "em", "b": "strong"}.get(name, name)
+    return f"<{slash}{canon}>"
+
+# Each icon is defined once in the shell's <defs> block below; articles
+# reference them with <use> so the path data is not repeated per row.
+ICON_COMMENT = '<svg class="i" width="14" height="14"><use href="#i-comment"/></svg>'
+ICON_LINK = '<svg class="i" width="14" height="14"><use href="#i-link"/></svg>'
+_ICON_STATUS = '<svg class="i" width="14" height="14"><use href="#i-status"/></svg>'
+_ICON_YEAR = '<svg class="i" width="14" height="14"><use href="#i-year"/></svg>'
+
+SHELL = """<!DOCTYPE HTML>
+<!--
+	Generated by build_publications.py -- do not edit by hand.
+	Design matches Read Only by HTML5 UP (see index.html).
+-->
+<html>
+	<head>
+		<title>Publications - Francisco Castro</title>
+		<meta charset="utf-8" />
+		<meta name="viewport" content="width=device-width, initial-scale=1" />
+		<link rel="stylesheet" href="assets/css/main.css" />
+		<style>
+			.publication {{ border-bottom: solid 1px #e5e5e5; padding: 1.5em 0; }}
+			.publication h4 {{ margin-bottom: 0.5em; }}
+			.pill {{ display: inline-block; background: #f0f0f0; border-radius: 1em; padding: 0.1em 0.8em; font-size: 0.8em; margin-right: 0.5em; }}
+			.pill .i, .links .i, .note .i {{ vertical-align: -0.125em; }}
+			.links a {{ margin-right: 0.75em; }}
+			details.cite pre, details.abstract p {{ font-size: 0.85em; margin: 0.5em 0 0 0; }}
+		</style>
+	</head>
+	<body>
+		<svg xmlns="http://www.w3.org/2000/svg" style="display: none">
+			<defs>
+				<symbol id="i-comment" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M21 11.5a8.38 8.38 0 0 1-.9 3.8 8.5 8.5 0 0 1-7.6 4.7 8.38 8.38 0 0 1-3.8-.9L3 21l1.9-5.7a8.38 8.38 0 0 1-.9-3.8 8.5 8.5 0 0 1 4.7-7.6 8.38 8.38 0 0 1 3.8-.9h.5a8.48 8.48 0 0 1 8 8v.5z"/></symbol>
+				<symbol id="i-link" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M18 13v6a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V8a2 2 0 0 1 2-2h6"/><polyline points="15 3 21 3 21 9"/><line x1="10" y1="14" x2="21" y2="3"/></symbol>
+				<symbol id="i-status" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M20.59 13.41l-7.17 7.17a2 2 0 0 1-2.83 0L2 12V2h10l8.59 8.59a2 2 0 0 1 0 2.83z"/><line x1="7" y1="7" x2="7.01" y2="7"/></symbol>
+				<symbol id="i-year" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="3" y="4" width="18" height="18" rx="2"/><line x1="16" y1="2" x2="16" y2="6"/><line x1="8" y1="2" x2="8" y2="6"/><line x1="3" y1="10" x2="21" y2="10"/></symbol>
+			</defs>
+		</svg>
+		<div id="wrapper">
+			<div id="main">
+				<section id="journal">
+					<div class="container">
+						<h3>Journal Publications</h3>
+						{JOURNAL_ITEMS}
+					</div>
+				</section>
+				<section id="conference">
+					<div class="container">
+						<h3>Conference Proceedings</h3>
+						{CONF_ITEMS}
+					</div>
+				</section>
+				<section id="working">
+					<div class="container">
+						<h3>Working Papers</h3>
+						{WORKING_ITEMS}
+					</div>
+				</section>
+				<section id="other">
+					<div class="container">
+						<h3>Other Writing</h3>
+						{OTHER_ITEMS}
+					</div>
+				</section>
+				<section>
+					<div class="container">
+						<p><a href="index.html">&larr; Back to main page</a></p>
+					</div>
+				</section>
+			</div>
+		</div>
+	</body>
+</html>
+"""
+
+
+# Characters html.escape would touch; most fields contain none of them.
+_UNSAFE = re.compile(r"[&<>\"']")
+
+# Ampersands in BibTeX fields, except those opening a numeric entity
+# (the CSV stores entries on one line with &#10; as the newline).
+_BIBTEX_AMP = re.compile(r"&(?!#\d+;)")
+
+
+def _bibtex_escape(s: str) -> str:
+    """Escape a BibTeX entry for <pre>, keeping &#10; entities intact."""
+    return _BIBTEX_AMP.sub("&amp;", s).replace("<", "&lt;").replace(">", "&gt;")
+
+
+def esc(s: str, _escape=html.escape) -> str:
+    """HTML-escape a CSV field (empty-safe, no-op for already-safe text)."""
+    if not s:
+        return ""
+    if _UNSAFE.search(s) is None:
+        return s
+    return _escape(s, quote=True)
+
+
+def fmt(t: str) -> str:
+    """Escape a field, then render **bold**/__bold__ and *em*/_em_.
+
+    A small whitelist of literal tags (<em>, <i>, <strong>, <b>) survives
+    escaping so CSV authors can mix raw tags with markdown.
+    """
+    t = esc(t)
+    t = _RE_BOLD_STAR.sub(r"<strong>\1</strong>", t)
+    t = _RE_BOLD_UND.sub(r"<strong>\1</strong>", t)
+    t = _RE_EM_STAR.sub(r"<em>\1</em>", t)
+    t = _RE_EM_UND.sub(r"<em>\1</em>", t)
+    t = _TAG_RE.sub(_tag_sub, t)
+    return t
+
+
+# Interned so per-row bucket lookups compare keys by pointer.
+_JOURNAL = sys.intern("journal")
+_WORKING = sys.intern("working")
+_CONF = sys.intern("conference")
+_OTHER = sys.intern("other")
+
+_SEC_MAP = {"jour": _JOURNAL, "work": _WORKING, "conf": _CONF}
+
+
+def normalize_section(s: str) -> str:
+    """Map a free-form section label to one of the four page buckets."""
+    return _SEC_MAP.get((s or "").strip().lower()[:4], _OTHER)
+
+
+def read_rows() -> "list[tuple]":
+    """Read publications.csv into a list of stripped namedtuples.
+
+    Uses the pandas C parser when pandas is installed (vectorized strip,
+    much faster on large files); otherwise falls back to csv.reader.
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+    if pd is not None:
+        df = pd.read_csv(CSV_FILE, dtype=str, keep_default_na=False)
+        df.columns = df.columns.str.strip()
+        for col in df.columns:
+            df[col] = df[col].str.strip()
+        Row = collections.namedtuple("Row", list(df.columns), rename=True)
+        return [Row(*vals) for vals in df.itertuples(index=False, name=None)]
+    with open(CSV_FILE, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = [h.strip() for h in next(reader)]
+        Row = collections.namedtuple("Row", header, rename=True)
+        width = len(header)
+        rows = []
+        for r in reader:
+            vals = [c.strip() for c in r[:width]]
+            if len(vals) < width:
+                vals.extend([""] * (width - len(vals)))
+            rows.append(Row(*vals))
+        return rows
+
+
+def pills(row: tuple, out: "list[str]") -> None:
+    """Append the status/year/venue pill row for one paper to out."""
+    status = getattr(row, "status", "")
+    year = getattr(row, "year", "")
+    venue = getattr(row, "venue", "")
+    if not (status or year or venue):
+        return
+    body = " ".join(
+        x
+        for x in (
+            f'<span class="pill" title="Status">{_ICON_STATUS} {esc(status)}</span>' if status else None,
+            f'<span class="pill" title="Year">{_ICON_YEAR} {esc(year)}</span>' if year else None,
+            f'<span class="pill" title="Venue">{esc(venue)}</span>' if venue else None,
+        )
+        if x
+    )
+    out.append(f'\n            <p class="pills">{body}</p>')
+
+
+def links(row: tuple, out: "list[str]") -> None:
+    """Append the paper/slides/code/media/bibtex link row for one paper to out."""
+    url = getattr(row, "paper_url", "")
+    slides = getattr(row, "slides_url", "")
+    code = getattr(row, "code_url", "")
+    media_raw = getattr(row, "media", "")
+    bibtex = getattr(row, "bibtex", "")
+    if not (url or slides or code or media_raw or bibtex):
+        return
+    out.append('\n            <p class="links">')
+    if url:
+        out.append(f'<a href="{esc(url)}">{ICON_LINK} Paper</a> ')
+    if slides:
+        out.append(f'<a href="{esc(slides)}">{ICON_LINK} Slides</a> ')
+    if code:
+        out.append(f'<a href="{esc(code)}">{ICON_LINK} Code</a> ')
+    if media_raw:
+        for item in media_raw.split(";"):
+            label, _, url2 = item.partition("|")
+            label = label.strip()
+            url2 = url2.strip()
+            if label and url2:
+                out.append(f'<a href="{esc(url2)}">{ICON_LINK} {esc(label)}</a> ')
+    if bibtex:
+        out.append(
+            '<details class="cite"><summary>BibTeX</summary><pre>'
+            + _bibtex_escape(bibtex)
+            + "</pre></details>"
+        )
+    out.append("</p>")
+
+
+def article(row: tuple, out: "list[str]") -> None:
+    """Append one CSV row as an <article> block to out."""
+    out.append('<article class="publication">\n            ')
+    title = fmt(getattr(row, "title", ""))
+    url = getattr(row, "paper_url", "")
+    if url:
+        out.append(f'<h4><a href="{esc(url)}">{title}</a></h4>')
+    else:
+        out.append(f"<h4>{title}</h4>")
+    authors = getattr(row, "authors", "")
+    if authors:
+        out.append(f'\n            <p class="authors">{fmt(authors)}</p>')
+    pills(row, out)
+    note = getattr(row, "note", "")
+    if note:
+        out.append(f'\n            <p class="note">{ICON_COMMENT} {fmt(note)}</p>')
+    abstract = getattr(row, "abstract", "")
+    if abstract:
+        out.append(
+            f'\n            <details class="abstract"><summary>Abstract</summary><p>{fmt(abstract)}</p></details>'
+        )
+    links(row, out)
+    out.append("\n          </article>")
+
+
+def _render_version() -> str:
+    """Fingerprint of this script, mixed into the render-cache keys so
+    edits to the renderer invalidate previously cached articles."""
+    with open(__file__, "rb") as f:
+        return hashlib.blake2b(f.read()).hexdigest()
+
+
+_RENDER_VERSION = _render_version()
+
+
+def _row_key(row: tuple) -> str:
+    """Stable content hash of one CSV row, used as the render-cache key."""
+    return hashlib.blake2b((_RENDER_VERSION + repr(row)).encode()).hexdigest()
+
+
+def _load_cache() -> "dict[str, str]":
+    if os.path.exists(CACHE_FILE):
+        try:
+            with open(CACHE_FILE, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+    return {}
+
+
+# Minimum number of cache misses before a process pool pays for itself.
+_POOL_THRESHOLD = 64
+
+
+def _render_row(row: tuple) -> str:
+    """Render one row to its <article> HTML."""
+    parts: "list[str]" = []
+    article(row, parts)
+    return "".join(parts)
+
+
+def _pool_init(fields: "tuple[str, ...]") -> None:
+    """Recreate the row type inside each worker process.
+
+    Rows travel to the pool as plain tuples because the Row namedtuple
+    is created at runtime and cannot be unpickled in a freshly spawned
+    worker; this runs once per worker under both fork and spawn.
+    """
+    global _POOL_ROW
+    _POOL_ROW = collections.namedtuple("Row", fields, rename=True)
+
+
+def _pool_render(vals: tuple) -> str:
+    return _render_row(_POOL_ROW(*vals))
+
+
+def main() -> None:
+    # No-op when the page is already newer than both its inputs.
+    if (
+        os.path.exists(OUT_FILE)
+        and os.path.getmtime(OUT_FILE) >= os.path.getmtime(CSV_FILE)
+        and os.path.getmtime(OUT_FILE) >= os.path.getmtime(__file__)
+    ):
+        print(f"{OUT_FILE} up-to-date")
+        return
+    rows = read_rows()
+    cache = _load_cache()
+    keys = [_row_key(r) for r in rows]
+    misses = [i for i, k in enumerate(keys) if k not in cache]
+    # Rows render independently, so large rebuilds fan out across cores;
+    # small ones stay in-process to avoid pool startup cost.
+    if len(misses) >= _POOL_THRESHOLD:
+        fields = type(rows[0])._fields
+        miss_vals = [tuple(rows[i]) for i in misses]
+        with concurrent.futures.ProcessPoolExecutor(
+            initializer=_pool_init, initargs=(fields,)
+        ) as ex:
+            for i, rendered in zip(misses, ex.map(_pool_render, miss_vals, chunksize=32)):
+                cache[keys[i]] = rendered
+    else:
+        for i in misses:
+            cache[keys[i]] = _render_row(rows[i])
+    secs = [normalize_section(getattr(r, "section", "")) for r in rows]
+    counts = collections.Counter(secs)
+    buckets = {k: [None] * counts[k] for k in (_JOURNAL, _CONF, _WORKING, _OTHER)}
+    idx = {k: counts[k] - 1 for k in buckets}
+    new_cache = {}
+    # CSV is oldest-first; filling each bucket from the back puts the
+    # newest paper first without a separate reverse pass.
+    for i, sec in enumerate(secs):
+        rendered = cache[keys[i]]
+        new_cache[keys[i]] = rendered
+        buckets[sec][idx[sec]] = rendered
+        idx[sec] -= 1
+    with open(CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(new_cache, f)
+    html_out = SHELL.format_map(
+        {
+            "JOURNAL_ITEMS": "\n".join(buckets["journal"]),
+            "CONF_ITEMS": "\n".join(buckets["conference"]),
+            "WORKING_ITEMS": "\n".join(buckets["working"]),
+            "OTHER_ITEMS": "\n".join(buckets["other"]),
+        }
+    )
+    with open(OUT_FILE, "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.write(html_out)
+    # Precompressed variants for hosts that serve *.gz/*.br directly.
+    # mtime=0 keeps the gzip output byte-identical across rebuilds.
+    data = html_out.encode("utf-8")
+    with gzip.GzipFile(OUT_FILE + ".gz", "wb", compresslevel=9, mtime=0) as f:
+        f.write(data)
+    try:
+        import brotli
+    except ImportError:
+        pass
+    else:
+        with open(OUT_FILE + ".br", "wb") as f:
+            f.write(brotli.compress(data, quality=11))
+    print(f"wrote {OUT_FILE} ({len(rows)} rows)")
+
+
+if __name__ == "__main__":
+    main()